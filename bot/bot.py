@@ -1,26 +1,48 @@
 import os
 import datetime
 import telebot
-import logging.config
-import json
+import logging
 from database import database
 from validators import validators
+from settings import settings
+from throttle import throttle
 
 
 # logging.basicConfig(filename='log.log', level=logging.DEBUG,
 #                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 # Load logging configuration from logging.ini
-logging.config.fileConfig('./logging.ini')
-logging.info("Starting bot successfully at: " + str(datetime.datetime.utcnow()) + " UTC")
+settings.configure_logging()
+logging.info("Starting bot successfully at: %s", datetime.datetime.now(datetime.timezone.utc))
+
+config = settings.get_config()
+
+
+class ThrottledTeleBot(telebot.TeleBot):
+    # queues outgoing messages instead of letting bursts run into 429 Too Many Requests
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.throttle = throttle.SendThrottle()
+
+    def send_message(self, chat_id, *args, **kwargs):
+        self.throttle.wait()
+        return super().send_message(chat_id, *args, **kwargs)
+
+    def send_photo(self, chat_id, *args, **kwargs):
+        self.throttle.wait()
+        return super().send_photo(chat_id, *args, **kwargs)
 
-with open('./config.json', 'r') as file:
-    config = json.load(file)
 
 # BOT_TOKEN = os.environ.get('BOT_TOKEN')
-bot = telebot.TeleBot(config['bot_token'])
-AUTHORIZED_IDS = config['authorized_ids']
+# Updates are handed to a pool of worker threads, so one slow handler does not stall other chats
+bot = ThrottledTeleBot(config['bot_token'], num_threads=config.get('num_threads', 2))
+AUTHORIZED_IDS = frozenset(config['authorized_ids'])
 ALLOWED_TYPES = config['allowed_types']
+# lower-cased allowed types for membership checks, and the list as shown in prompts
+ALLOWED_TYPES_LOWER = frozenset(t.lower() for t in ALLOWED_TYPES)
+ALLOWED_TYPES_TEXT = " or ".join(ALLOWED_TYPES)
+# accepted answers to availability questions, compared in lower case
+YES_NO = frozenset(('yes', 'no'))
 
 
 class UserInput:
@@ -33,6 +55,30 @@ class UserInput:
         self.availability = availability
 
 
+def reply_keyboard(*labels, **kwargs):
+    keyboard = telebot.types.ReplyKeyboardMarkup(**kwargs)
+    for label in labels:
+        keyboard.add(telebot.types.KeyboardButton(label))
+    return keyboard
+
+
+# Markups never change, so they are built once and reused for every message
+FORCE_REPLY = telebot.types.ForceReply()
+WELCOME_KEYBOARD = reply_keyboard('Get', 'Add', 'Admin', 'Send test message', 'Change availability status')
+CONFIRM_KEYBOARD = reply_keyboard('Request is correct', 'No, I want to edit my request', is_persistent=True)
+EDIT_KEYBOARD = reply_keyboard('Item name', 'Amount of items', 'Item type')
+EDIT_SPARE_PART_KEYBOARD = reply_keyboard('Item name', 'Amount of items', 'Item type', 'Item price', 'Availability')
+
+MENU_KEYBOARD = telebot.types.InlineKeyboardMarkup()
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Get', callback_data='Get'))
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Add', callback_data='Add'))
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Admin', callback_data='Admin'))
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Change availability status',
+                                                     callback_data='availability_status'))
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Send test message', callback_data='Send test message'))
+MENU_KEYBOARD.add(telebot.types.InlineKeyboardButton('Stop', callback_data='stop_bot'))
+
+
 demo_message = UserInput(item_name='My Item',
                          item_amount=1,
                          item_type='spare part',
@@ -48,69 +94,27 @@ def send_demo_message(message):
 @bot.message_handler(commands=['start'])
 def send_welcome(message):
     logging.info("Received '/start' command")
-    keyboard = telebot.types.ReplyKeyboardMarkup()
-    keyboard.add(telebot.types.KeyboardButton('Get'))
-    keyboard.add(telebot.types.KeyboardButton('Add'))
-    keyboard.add(telebot.types.KeyboardButton('Admin'))
-    keyboard.add(telebot.types.KeyboardButton('Send test message'))
-    keyboard.add(telebot.types.KeyboardButton('Change availability status'))
     bot.send_message(message.chat.id,
                      "Hi! :)\nI'm organizer bot. I will help you to add your items.",
-                     reply_markup=keyboard)
+                     reply_markup=WELCOME_KEYBOARD)
 
 
 @bot.message_handler(commands=['menu'])
 def menu(message):
-    keyboard = telebot.types.InlineKeyboardMarkup()
-    keyboard.add(telebot.types.InlineKeyboardButton('Get', callback_data='Get'))
-    keyboard.add(telebot.types.InlineKeyboardButton('Add', callback_data='Add'))
-    keyboard.add(telebot.types.InlineKeyboardButton('Admin', callback_data='Admin'))
-    keyboard.add(telebot.types.InlineKeyboardButton('Change availability status', callback_data='availability_status'))
-    keyboard.add(telebot.types.InlineKeyboardButton('Send test message', callback_data='Send test message'))
-    keyboard.add(telebot.types.InlineKeyboardButton('Stop', callback_data='stop_bot'))
-    bot.send_message(message.chat.id, 'What you want to do?', reply_markup=keyboard)
-
-
-@bot.message_handler(regexp='^admin$')
-def admin(message):
-    bug(message)
-
-
-@bot.message_handler(regexp='^get$')
-def get(message):
-    get_items_from_database(message)
-
+    bot.send_message(message.chat.id, 'What you want to do?', reply_markup=MENU_KEYBOARD)
 
-@bot.message_handler(regexp='^add$')
-def add(message):
-    add_item(message)
 
-
-@bot.message_handler(regexp='^Send test message$')
-def test(message):
-    send_demo_message(message)
-
-
-@bot.message_handler(regexp='^Change availability status$')
-def availability_status(message):
-    update_availability_status(message)
-
-
-@bot.message_handler(regexp='^stop_bot$')
-def stop(message):
-    stop_bot(message)
+@bot.message_handler(func=lambda msg: msg.text.lower() in TEXT_COMMANDS)
+def text_command(message):
+    # reply keyboard buttons are matched and dispatched by a single dict lookup
+    TEXT_COMMANDS[message.text.lower()](message)
 
 
 @bot.callback_query_handler(func=lambda c: True)
 def submenus(c):
-    if c.data == 'Add':
-        add_item(c.message)
-    elif c.data == 'Get':
-        bug(c.message)
-    elif c.data == 'Admin':
-        bug(c.message)
-    elif c.data == 'Send test message':
-        send_demo_message(c.message)
+    action = MENU_CALLBACKS.get(c.data)
+    if action:
+        action(c.message)
 
 
 @bot.message_handler(func=lambda msg: True)
@@ -127,7 +131,7 @@ def bug(message):
 
 def add_item(message):
     if validators.check_working_hours():
-        msg = bot.send_message(message.chat.id, 'Please provide name of item:', reply_markup=telebot.types.ForceReply())
+        msg = bot.send_message(message.chat.id, 'Please provide name of item:', reply_markup=FORCE_REPLY)
         order = UserInput()
         bot.register_next_step_handler(msg, check_item_name, order)
     else:
@@ -142,13 +146,13 @@ def check_item_name(message, order):
     if validators.text_input_validator(message):
         order.item_name = message.text
         msg = bot.send_message(message.chat.id, 'Please provide amount of items:',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_amount, order)
     else:
         msg = bot.send_message(message.chat.id,
                                f'{message.text} is invalid.\n'
                                f'Please provide item name:',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_name, order)
 
 
@@ -158,39 +162,26 @@ def check_availability_name(message):
         name = message.text.upper()
         print('name', name)
         msg = bot.send_message(message.chat.id, 'Please provide availability status of item YES/NO :',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_availability_item, name)
 
 
 def check_availability_item(message, item):
-    if message.text.upper() == "YES":
-        bot.send_message(message.chat.id,
-                         f'Update availability status.\n'
-                         f'Item {item}. \n'
-                         f'Availability - not available')
-        # Establish connection to Postgres database
-        conn = database.create_database_connection()
-        if conn is not None:
-            try:
-                # Update availability status in Postgres database
-                database.update_availability_in_database(conn, item, True)
-            finally:
-                # Close the connection to the Postgres database
-                if conn:
-                    conn.close()
-    elif message.text.upper() == "NO":
+    answer = (message.text or '').lower()
+    if answer in YES_NO:
+        available = answer == 'yes'
         bot.send_message(message.chat.id,
                          f'Update availability status.\n'
                          f'Item {item}. \n'
-                         f'Availability - not available')
+                         f'Availability - {"available" if available else "not available"}')
         # Establish connection to Postgres database
         conn = database.create_database_connection()
         if conn is not None:
             try:
                 # Update availability status in Postgres database
-                database.update_availability_in_database(conn, item, False)
+                database.update_availability_in_database(conn, item, available)
             finally:
-                # Close the connection to the Postgres database
+                # Return the connection to the pool
                 if conn:
                     conn.close()
     else:
@@ -203,33 +194,29 @@ def check_item_amount(message, request):
     # message.text - value of user input
     if validators.is_int(message.text):
         request.item_amount = message.text
-        msg = bot.send_message(message.chat.id, 'Please provide item type:', reply_markup=telebot.types.ForceReply())
+        msg = bot.send_message(message.chat.id, 'Please provide item type:', reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_type, request)
     else:
         msg = bot.send_message(message.chat.id,
                                f'{message.text} is invalid.\n'
                                f'Please provide item amount:',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_amount, request)
 
 
 def check_item_type(message, request):
-    if message.text.lower() not in [x.lower() for x in ALLOWED_TYPES]:
+    item_type = message.text.lower()
+    if item_type not in ALLOWED_TYPES_LOWER:
         msg = bot.send_message(message.chat.id,
                                f'{message.text} is not allowed item type.'
-                               f' Allowed Items Types are: {" or ".join(ALLOWED_TYPES)}.\nPlease provide item type:',
-                               reply_markup=telebot.types.ForceReply())
+                               f' Allowed Items Types are: {ALLOWED_TYPES_TEXT}.\nPlease provide item type:',
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_type, request)
     else:
-        request.item_type = message.text.lower()
-        if message.text.lower() == 'spare part':
-            msg = bot.send_message(message.chat.id, 'Please provide item price value:',
-                                   reply_markup=telebot.types.ForceReply())
-            bot.register_next_step_handler(msg, check_item_price_value, request)
-        else:
-            msg = bot.send_message(message.chat.id, 'Please provide item price value:',
-                                   reply_markup=telebot.types.ForceReply())
-            bot.register_next_step_handler(msg, check_item_price_value, request)
+        request.item_type = item_type
+        msg = bot.send_message(message.chat.id, 'Please provide item price value:',
+                               reply_markup=FORCE_REPLY)
+        bot.register_next_step_handler(msg, check_item_price_value, request)
 
 
 def check_item_price_value(message, request):
@@ -238,22 +225,20 @@ def check_item_price_value(message, request):
         msg = bot.send_message(message.chat.id,
                                f'price {message.text} is correct.\n'
                                f'Please provide availability status:',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_availability_status, request)
     else:
         msg = bot.send_message(message.chat.id,
                                f'{message.text} is invalid.\n'
                                f'Please provide item price value:',
-                               reply_markup=telebot.types.ForceReply())
+                               reply_markup=FORCE_REPLY)
         bot.register_next_step_handler(msg, check_item_price_value, request)
 
 
 def check_availability_status(message, request):
-    if message.text == 'yes':
-        request.availability = True
-        validate_request(message, request)
-    elif message.text == 'no':
-        request.availability = False
+    answer = (message.text or '').lower()
+    if answer in YES_NO:
+        request.availability = answer == 'yes'
         validate_request(message, request)
     elif message.text:
         msg = bot.send_message(message.chat.id,
@@ -261,19 +246,28 @@ def check_availability_status(message, request):
         bot.register_next_step_handler(msg, check_availability_status, request)
 
 
-def validate_request(message, request):
-    keyboard = telebot.types.ReplyKeyboardMarkup(is_persistent=True)
-    keyboard.add(telebot.types.KeyboardButton('Request is correct'))
-    keyboard.add(telebot.types.KeyboardButton('No, I want to edit my request'))
-    text = f'Please check values:{os.linesep}' \
-           f'Item name: {request.item_name}, {os.linesep}' \
-           f'Items amount: {request.item_amount}, {os.linesep}' \
-           f'Item type: {request.item_type}, {os.linesep}'
+# Item details templates, filled from the request attributes
+ITEM_TEXT = os.linesep.join(('Item name: {item_name}, ',
+                             'Amount of items: {item_amount}, ',
+                             'Item type: {item_type}, ',
+                             ''))
+SPARE_PART_TEXT = os.linesep.join(('Item price: {item_price}, ',
+                                   'Availability: {availability}, ',
+                                   ''))
+
+
+def format_request(request):
+    # item details shown both when reviewing and when confirming a request
+    fields = vars(request)
+    text = ITEM_TEXT.format_map(fields)
     if request.item_type == 'spare part':
-        text.join(f'Item price: {request.item_price}, {os.linesep}')
-        text.join(f'Availability: {request.availability}, {os.linesep}')
-    text += f'Is request correct?'
-    msg = bot.send_message(message.chat.id, text, reply_markup=keyboard)
+        text += SPARE_PART_TEXT.format_map(fields)
+    return text
+
+
+def validate_request(message, request):
+    text = f'Please check values:{os.linesep}{format_request(request)}Is request correct?'
+    msg = bot.send_message(message.chat.id, text, reply_markup=CONFIRM_KEYBOARD)
 
     bot.register_next_step_handler(msg, request_decision_handler, request)
 
@@ -297,13 +291,7 @@ def ok_request(message, request):
             # Insert data into Postgres database
             if database.insert_item(session, message, request):
                 # Construct the text message to send
-                text = f'Request is placed for processing:{os.linesep}' \
-                       f'Item name: {request.item_name}, {os.linesep}' \
-                       f'Amount of items: {request.item_amount}, {os.linesep}' \
-                       f'Item type: {request.item_type}, {os.linesep}'
-                if request.item_type == 'spare part':
-                    text += f'Item price: {request.item_price}, {os.linesep}'
-                    text += f'Availability: {request.availability}, {os.linesep}'
+                text = f'Request is placed for processing:{os.linesep}{format_request(request)}'
                 # Send the text message using the bot
                 bot.send_message(message.chat.id, text)
                 logging.info("Message was sent to the database module")
@@ -312,7 +300,7 @@ def ok_request(message, request):
                 logging.error("Failed to process the request to database module.")
         except Exception as e:
             bot.send_message(message.chat.id, f"An error occurred: {e}")
-            logging.error(f"An error occurred: {e}")
+            logging.error("An error occurred: %s", e)
         finally:
             # Close the connection to the Postgres database
             if session:
@@ -320,57 +308,45 @@ def ok_request(message, request):
 
 
 def edit_request(message, request):
-    keyboard = telebot.types.ReplyKeyboardMarkup()
-    keyboard.add(telebot.types.KeyboardButton('Item name'))
-    keyboard.add(telebot.types.KeyboardButton('Items amount'))
-    keyboard.add(telebot.types.KeyboardButton('Item type'))
-    if request.item_type == 'spare part':
-        keyboard.add(telebot.types.KeyboardButton('Item price'))
-        keyboard.add(telebot.types.KeyboardButton('Availability'))
+    keyboard = EDIT_SPARE_PART_KEYBOARD if request.item_type == 'spare part' else EDIT_KEYBOARD
     msg = bot.send_message(message.chat.id, 'What do you want to edit?', reply_markup=keyboard)
     bot.register_next_step_handler(msg, edit_request_values, request)
 
 
+# Maps edit keyboard button text to the request field being edited
+EDIT_TYPES = {
+    'Item name': 'name',
+    'Amount of items': 'amount',
+    'Item type': 'type',
+    'Item price': 'item_price',
+    'Availability': 'availability',
+}
+
+
 def edit_request_values(message, request):
-    if message.text == 'Item name':
-        edit_type = 'name'
-    elif message.text == 'Amount of items':
-        edit_type = 'amount'
-    elif message.text == 'Item type':
-        edit_type = 'type'
-    elif message.text == 'Item price':
-        edit_type = 'item_price'
-    elif message.text == 'Availability':
-        edit_type = 'availability'
-    else:
-        edit_type = 'unknown'
+    edit_items_value(message, request, EDIT_TYPES.get(message.text, 'unknown'))
 
-    edit_items_value(message, request, edit_type)
+
+# Prompt asking for the new value of each editable field
+EDIT_PROMPTS = {
+    'name': 'Please provide new Item name:',
+    'amount': 'Please provide new amount:',
+    'type': 'Please provide new Item type:',
+    'item_price': 'Please provide new item price:',
+    'availability': 'Please provide new availability status:',
+}
 
 
 def edit_items_value(message, request, items_type):
-    if items_type == 'name':
-        msg = bot.send_message(message.chat.id, 'Please provide new Item name:',
-                               reply_markup=telebot.types.ForceReply())
-    elif items_type == 'amount':
-        msg = bot.send_message(message.chat.id, 'Please provide new amount:',
-                               reply_markup=telebot.types.ForceReply())
-    elif items_type == 'type':
-        msg = bot.send_message(message.chat.id, 'Please provide new Item type:',
-                               reply_markup=telebot.types.ForceReply())
-    elif items_type == 'item_price':
-        msg = bot.send_message(message.chat.id, 'Please provide new item price:',
-                               reply_markup=telebot.types.ForceReply())
-    elif items_type == 'availability':
-        msg = bot.send_message(message.chat.id, 'Please provide new availability status:',
-                               reply_markup=telebot.types.ForceReply())
-    else:
+    prompt = EDIT_PROMPTS.get(items_type)
+    if prompt is None:
         msg = bot.send_message(message.chat.id, f'Seems you provide wrong value... {os.linesep}'
                                                 f'Try again.{os.linesep}'
                                                 f'What do you want to edit?')
 
         bot.register_next_step_handler(msg, edit_request_values, request)
         return
+    msg = bot.send_message(message.chat.id, prompt, reply_markup=FORCE_REPLY)
     bot.register_next_step_handler(msg, update_items_value, request, items_type)
 
 
@@ -383,7 +359,7 @@ def update_items_value(message, request, items_type):
             msg = bot.send_message(message.chat.id,
                                    f'{message.text} is invalid.\n'
                                    f'Please provide item name:',
-                                   reply_markup=telebot.types.ForceReply())
+                                   reply_markup=FORCE_REPLY)
             bot.register_next_step_handler(msg, update_items_value, request, 'name')
     elif items_type == 'amount':
         if validators.is_int(message.text):
@@ -392,15 +368,15 @@ def update_items_value(message, request, items_type):
             msg = bot.send_message(message.chat.id,
                                    f'{message.text} is invalid.\n'
                                    f'Please provide amount of items:',
-                                   reply_markup=telebot.types.ForceReply())
+                                   reply_markup=FORCE_REPLY)
             bot.register_next_step_handler(msg, update_items_value, request, 'amount')
     elif items_type == 'type':
-        if message.text.lower() not in [x.lower() for x in ALLOWED_TYPES]:
+        if message.text.lower() not in ALLOWED_TYPES_LOWER:
             msg = bot.send_message(message.chat.id,
                                    f'{message.text} is not allowed Item type.'
-                                   f' Allowed Item Types are: {" or ".join(ALLOWED_TYPES)}.\nPlease provide '
+                                   f' Allowed Item Types are: {ALLOWED_TYPES_TEXT}.\nPlease provide '
                                    'Item type:',
-                                   reply_markup=telebot.types.ForceReply())
+                                   reply_markup=FORCE_REPLY)
             bot.register_next_step_handler(msg, edit_items_value, request, 'type')
         else:
             request.item_type = message.text.lower()
@@ -411,13 +387,18 @@ def update_items_value(message, request, items_type):
             msg = bot.send_message(message.chat.id,
                                    f'{message.text} is invalid.\n'
                                    f'Please provide item price value:',
-                                   reply_markup=telebot.types.ForceReply())
+                                   reply_markup=FORCE_REPLY)
             bot.register_next_step_handler(msg, update_items_value, request, 'limit_price')
-    elif items_type == "spare part":
-        if message.text == "yes":
-            request.availability = True
-        if message.text == "no":
-            request.availability = False
+    elif items_type == 'availability':
+        answer = (message.text or '').lower()
+        if answer in YES_NO:
+            request.availability = answer == 'yes'
+        else:
+            msg = bot.send_message(message.chat.id,
+                                   'Incorrect value, must be yes/no',
+                                   reply_markup=FORCE_REPLY)
+            bot.register_next_step_handler(msg, update_items_value, request, 'availability')
+            return
     else:
         msg = bot.send_message(message.chat.id, f'Wrong value provided. {os.linesep}Try again')
         bot.register_next_step_handler(msg, edit_request, request)
@@ -428,16 +409,17 @@ def update_items_value(message, request, items_type):
 
 def update_availability_status(message):
     msg = bot.send_message(message.chat.id, 'Please provide availability '
-                                            'status:', reply_markup=telebot.types.ForceReply())
+                                            'status:', reply_markup=FORCE_REPLY)
     bot.register_next_step_handler(msg, check_availability_name)
 
 
 # Define a signal handler to stop the bot gracefully
 @bot.message_handler(commands=['stop'])
 def stop_bot(message):
-    if message.chat.id not in AUTHORIZED_IDS:
-        bot.send_message(message.chat.id, f"Your ID ({message.chat.id}) is not authorized to stop bot")
-        logging.warning(f"Unauthorized attempt to stop bot from chat {message.chat.id}")
+    chat_id = message.chat.id
+    if chat_id not in AUTHORIZED_IDS:
+        bot.send_message(chat_id, f"Your ID ({chat_id}) is not authorized to stop bot")
+        logging.warning("Unauthorized attempt to stop bot from chat %s", chat_id)
         return
     logging.info("Stopping bot...")
     print("Stopping bot...")
@@ -445,30 +427,52 @@ def stop_bot(message):
 
     bot.stop_polling()
 
-    logging.info("Bot stopped at: " + str(datetime.datetime.utcnow()) + " UTC")
+    logging.info("Bot stopped at: %s", datetime.datetime.now(datetime.timezone.utc))
     print("Bot stopped.")
     exit(0)
 
 
+ITEMS_HEADER = "Items in the database:\n"
+
+
 def get_items_from_database(message):
     session = database.create_database_session()
     try:
         start_date = datetime.datetime(2024, 1, 1)
         end_date = datetime.datetime(2024, 2, 1)
-        items = database.get_items(session, item_name='test', start_date=start_date, end_date=end_date)
-        if items:
-            item_info = "\n".join([f"Item: {item.item_name}, Amount: {item.item_amount}" for item in items])
-            bot.send_message(message.chat.id, f"Items in the database:\n{item_info}")
+        items = database.iter_items(session, item_name='test', start_date=start_date, end_date=end_date)
+        item_info = "\n".join("Item: %s, Amount: %s" % (item.item_name, item.item_amount) for item in items)
+        if item_info:
+            bot.send_message(message.chat.id, ITEMS_HEADER + item_info)
         else:
             bot.send_message(message.chat.id, "The item not found in the database.")
     except Exception as e:
         bot.send_message(message.chat.id, f"An error occurred: {e}")
-        logging.error(f"Failed get items from database with error: {e}")
+        logging.error("Failed get items from database with error: %s", e)
     finally:
         if session:
             session.close()
 
 
+# Maps reply keyboard button text (lower case) to its action
+TEXT_COMMANDS = {
+    'admin': bug,
+    'get': get_items_from_database,
+    'add': add_item,
+    'send test message': send_demo_message,
+    'change availability status': update_availability_status,
+    'stop_bot': stop_bot,
+}
+
+# Maps inline menu callback data to its action
+MENU_CALLBACKS = {
+    'Add': add_item,
+    'Get': bug,
+    'Admin': bug,
+    'Send test message': send_demo_message,
+}
+
+
 # Register the signal handler for SIGINT and SIGTERM
 # signal.signal(signal.SIGINT, stop_bot)
 # signal.signal(signal.SIGTERM, stop_bot)
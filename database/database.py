@@ -1,41 +1,34 @@
-import os
-import json
-import logging.config
+import logging
 import datetime
 import psycopg2
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exc, insert, lambda_stmt, select
 from sqlalchemy.orm import sessionmaker
 from database.models import Base, Item
+from settings import settings
 
 
-root_dir = os.path.dirname(os.path.dirname(__file__))
-# Load the logging configuration from the absolute path
-log_config_path = os.path.join(root_dir, 'logging.ini')
-logging.config.fileConfig(log_config_path)
-# logging.config.fileConfig('./logging.ini')
+settings.configure_logging()
+config = settings.get_config()
 
-# Create a logger specific to this module
-# logger = logging.getLogger(__name__)
-
-# Set the log level
-# logger.setLevel(logging.DEBUG)
-
-logging.debug('This is a test debug message')
-logging.info('This is a test info message')
-logging.error('This is a test error message')
-
-
-with open('./config.json', 'r') as file:
-    config = json.load(file)
+# Every bot worker thread holds at most one session or connection at a time
+NUM_THREADS = config.get('num_threads', 2)
 
 DB_URL = config['database']['db_url']
-engine = create_engine(DB_URL, echo=True)
+DB_POOL_SIZE = config['database'].get('pool_size', max(5, NUM_THREADS))
+DB_MAX_OVERFLOW = config['database'].get('max_overflow', NUM_THREADS)
+DB_POOL_TIMEOUT = config['database'].get('pool_timeout', 5)
+DB_POOL_RECYCLE = config['database'].get('pool_recycle', 1800)
+# SQL logging is for debugging only, it shows per statement whether the compiled form came from the cache
+DB_ECHO = config['database'].get('echo', False)
+# Stale connections are detected at checkout and recycled before the server or a proxy drops them
+engine = create_engine(DB_URL, echo=DB_ECHO,
+                       query_cache_size=1200,
+                       pool_size=DB_POOL_SIZE,
+                       max_overflow=DB_MAX_OVERFLOW,
+                       pool_timeout=DB_POOL_TIMEOUT,
+                       pool_pre_ping=True,
+                       pool_recycle=DB_POOL_RECYCLE)
 
-DB_NAME = config['database']['db_name']
-DB_USER = config['database']['user']
-DB_PASSWORD = config['database']['password']
-DB_HOST = config['database']['host']
-DB_PORT = config['database']['port']
 DB_TABLE_NAME = config['database']['table_name']
 
 Base.metadata.bind = engine
@@ -50,58 +43,60 @@ def create_database_session():
 
 def insert_item(session, message, request):
     try:
-        item = Item(
+        # Single-row insert goes through Core, no ORM object or unit of work is needed
+        session.execute(insert(Item).values(
             item_name=request.item_name,
             item_amount=request.item_amount,
             item_type=request.item_type,
             item_price=request.item_price,
             availability=request.availability,
             chat_id=message.chat.id,
-            timestamp=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-        )
-        session.add(item)
+            # Stored as naive UTC in the TIMESTAMP WITHOUT TIME ZONE column
+            timestamp=datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        ))
         session.commit()
         logging.info("The item was inserted in the database")
         return True
     except Exception as e:
         session.rollback()
-        logging.error(f"Error inserting data into database: {e}")
+        logging.error("Error inserting data into database: %s", e)
         print(f"Error inserting data into database: {e}")
         return False
-    finally:
-        session.close()
 
 
-def get_items(session, item_name=None, start_date=None, end_date=None):
-    query = session.query(Item)
+def iter_items(session, item_name=None, start_date=None, end_date=None, batch_size=50):
+    # Lambda statement: the compiled SQL is cached per filter combination, filter values become bound parameters
+    stmt = lambda_stmt(lambda: select(Item))
     if item_name:
-        query = query.filter(Item.item_name == item_name)
+        stmt += lambda s: s.where(Item.item_name == item_name)
     if start_date and end_date:
-        query = query.filter(Item.timestamp.between(start_date, end_date))
-    return query.all()
+        stmt += lambda s: s.where(Item.timestamp.between(start_date, end_date))
+    # Rows are fetched from a server-side cursor in batches instead of being loaded all at once
+    return session.scalars(stmt, execution_options={'yield_per': batch_size})
+
+
+def get_items(session, item_name=None, start_date=None, end_date=None):
+    return list(iter_items(session, item_name=item_name, start_date=start_date, end_date=end_date))
 
 
 def create_database_connection():
     conn = None
     try:
-        conn = psycopg2.connect(
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            host=DB_HOST,
-            port=DB_PORT
-        )
+        # Raw psycopg2 connection checked out of the engine pool, conn.close() returns it.
+        # The pool pings it on checkout and recycles old ones, so a dropped connection is not handed out.
+        conn = engine.raw_connection()
         logging.info("Connected to the database")
         print("Connected to the database")
-    except psycopg2.Error as e:
-        logging.error(f"Database connection error: {e}")
+    except exc.SQLAlchemyError as e:
+        # also covers pool TimeoutError when every pooled connection is in use
+        logging.error("Database connection error: %s", e)
         print(f"Error: {e}")
     return conn
 
 
 def insert_data_into_database(conn, message, request):
     cursor = conn.cursor()
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+    timestamp = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
     try:
         # Construct the SQL INSERT query
         sql_query = f"""INSERT INTO {DB_TABLE_NAME} (item_name, item_amount, item_type, item_price, 
@@ -118,7 +113,7 @@ def insert_data_into_database(conn, message, request):
         logging.info("Data inserted into Postgres database")
         print("Data inserted into Postgres database")
     except psycopg2.Error as e:
-        logging.error(f"Error inserting data into Postgres database: {e}")
+        logging.error("Error inserting data into Postgres database: %s", e)
         print(f"Error inserting data into Postgres database: {e}")
         conn.rollback()
     finally:
@@ -130,19 +125,20 @@ def update_availability_in_database(conn, item, availability):
     cursor = conn.cursor()
     try:
         # Construct the SQL UPDATE query
-        sql_query = f"""UPDATE {DB_NAME}.{DB_TABLE_NAME} 
+        # Exact, case-insensitive name match, served by the lower(item_name) index
+        sql_query = f"""UPDATE {DB_TABLE_NAME} 
                                 SET availability = %s 
-                                WHERE item = %s"""
+                                WHERE lower(item_name) = %s"""
 
         # Execute the SQL query to update availability status
-        cursor.execute(sql_query, (availability, item))
+        cursor.execute(sql_query, (availability, item.lower()))
 
         # Commit the transaction
         conn.commit()
         logging.info("Availability status updated in Postgres database")
         print("Availability status updated in Postgres database")
     except psycopg2.Error as e:
-        logging.error(f"Error updating availability status in Postgres database: {e}")
+        logging.error("Error updating availability status in Postgres database: %s", e)
         print(f"Error updating availability status in Postgres database: {e}")
         conn.rollback()
     finally:
@@ -163,6 +159,6 @@ def get_data_from_database(conn):
         conn.commit()
         logging.info("Data selected from Postgres database")
     except psycopg2.Error as e:
-        logging.error(f"Error selecting data from Postgres database: {e}")
+        logging.error("Error selecting data from Postgres database: %s", e)
         conn.rollback()
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 
 
@@ -17,5 +17,12 @@ class Item(Base):
     timestamp = Column(DateTime)
     chat_id = Column(Integer)
 
+    # iter_items() filters by item name and a timestamp range,
+    # update_availability_in_database() matches lower(item_name)
+    __table_args__ = (
+        Index('ix_organizer_table_item_name_timestamp', 'item_name', 'timestamp'),
+        Index('ix_organizer_table_lower_item_name', func.lower(item_name)),
+    )
+
     def __repr__(self):
         return f"<Item(id={self.id}, item_name={self.item_name}, item_amount={self.item_amount})>"
@@ -0,0 +1,24 @@
+import logging.config
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=1)
+def configure_logging(path=ROOT_DIR / 'logging.ini'):
+    # logging.ini is applied once per process, later calls are no-ops
+    logging.config.fileConfig(path)
+
+
+@lru_cache(maxsize=1)
+def get_config(path=ROOT_DIR / 'config.json'):
+    # config.json is parsed once per process, every module gets the same dict
+    with open(path, 'rb') as file:
+        return json_parser.loads(file.read())
@@ -0,0 +1,41 @@
+import pytest
+from throttle import throttle
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # fake monotonic clock, sleeping advances it instead of blocking
+    state = {'now': 100.0, 'slept': []}
+
+    def sleep(seconds):
+        state['slept'].append(seconds)
+        state['now'] += seconds
+
+    monkeypatch.setattr(throttle.time, 'monotonic', lambda: state['now'])
+    monkeypatch.setattr(throttle.time, 'sleep', sleep)
+    return state
+
+
+def test_first_send_is_not_delayed(clock):
+    assert throttle.SendThrottle(per_second=10).reserve() == 0
+
+
+def test_burst_is_spaced_by_interval(clock):
+    send_throttle = throttle.SendThrottle(per_second=10)
+    delays = [send_throttle.reserve() for _ in range(3)]
+    assert delays == pytest.approx([0.0, 0.1, 0.2])
+
+
+def test_idle_time_is_not_banked(clock):
+    send_throttle = throttle.SendThrottle(per_second=10)
+    send_throttle.reserve()
+    clock['now'] += 5
+    assert send_throttle.reserve() == 0
+    assert send_throttle.reserve() == pytest.approx(0.1)
+
+
+def test_wait_sleeps_only_when_delayed(clock):
+    send_throttle = throttle.SendThrottle(per_second=10)
+    send_throttle.wait()
+    send_throttle.wait()
+    assert clock['slept'] == pytest.approx([0.1])
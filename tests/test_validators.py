@@ -0,0 +1,87 @@
+import datetime
+import importlib
+from types import SimpleNamespace
+import pytest
+from settings import settings
+
+
+TEST_CONFIG = {'min_len_str': 1, 'max_len_str': 10, 'skip_working_hours': 'False'}
+
+
+@pytest.fixture(scope='module')
+def validators():
+    # the module reads config.json at import time, so it is loaded against a test config
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(settings, 'get_config', lambda: TEST_CONFIG)
+        yield importlib.reload(importlib.import_module('validators.validators'))
+
+
+def freeze_time(monkeypatch, validators, *args):
+    # check_working_hours() reads the clock through the module's datetime import
+    now = datetime.datetime(*args, tzinfo=validators.WORKING_HOURS_TZ)
+    fake_datetime = SimpleNamespace(now=lambda tz: now.astimezone(tz))
+    monkeypatch.setattr(validators, 'datetime', SimpleNamespace(datetime=fake_datetime))
+
+
+@pytest.mark.parametrize('moment, expected', [
+    ((2024, 3, 8, 19, 59), True),    # Friday, last open minute
+    ((2024, 3, 8, 20, 0), False),    # Friday, closing time
+    ((2024, 3, 9, 12, 0), False),    # Saturday
+    ((2024, 3, 10, 12, 0), False),   # Sunday
+    ((2024, 3, 11, 9, 29), False),   # Monday, before opening
+    ((2024, 3, 11, 9, 30), True),    # Monday, opening time
+])
+def test_check_working_hours(monkeypatch, validators, moment, expected):
+    freeze_time(monkeypatch, validators, *moment)
+    assert validators.check_working_hours() is expected
+
+
+def test_check_working_hours_skipped(monkeypatch, validators):
+    freeze_time(monkeypatch, validators, 2024, 3, 9, 12, 0)
+    monkeypatch.setattr(validators, 'SKIP_WORKING_HOURS', True)
+    assert validators.check_working_hours() is True
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('', False),
+    (None, False),              # photo, sticker or voice reply
+    ('a', True),
+    ('a' * 10, True),
+    ('a' * 11, False),
+    ('Bolt M6 #2', True),
+    ('tab\there', True),
+    ('café', False),            # non-ASCII letter
+    ('болт', False),
+    ('a\u00a0b', True),         # no-break space
+    ('a\u0085b', True),         # next line
+    ('a\x1fb', True),           # unit separator
+    ('a\x00b', False),
+])
+def test_text_input_validator(validators, text, expected):
+    assert validators.text_input_validator(SimpleNamespace(text=text)) is expected
+
+
+@pytest.mark.parametrize('string, expected', [
+    ('5', True),
+    ('-5', True),
+    (' 5', True),
+    ('5.', False),
+    ('.', False),
+    ('1e3', False),
+    ('\u0663', True),           # Arabic-Indic digit three
+])
+def test_is_int(validators, string, expected):
+    assert validators.is_int(string) is expected
+
+
+@pytest.mark.parametrize('string, expected', [
+    ('5', True),
+    ('-5', True),
+    (' 5', True),
+    ('5.', True),
+    ('.', False),
+    ('1e3', True),
+    ('\u0663', True),
+])
+def test_is_float(validators, string, expected):
+    assert validators.is_float(string) is expected
@@ -0,0 +1,25 @@
+import time
+import threading
+
+
+class SendThrottle:
+    # this class spaces outgoing messages to stay within the Telegram limit
+    # of about 30 messages per second bot-wide
+    def __init__(self, per_second=30):
+        self._lock = threading.Lock()
+        self._interval = 1.0 / per_second
+        self._next_slot = 0.0
+
+    def reserve(self):
+        # book the next free slot and return the delay until it starts
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        return slot - now
+
+    def wait(self):
+        # the slot is reserved under the lock, the sleep happens outside of it
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
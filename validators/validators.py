@@ -1,54 +1,69 @@
-import re
-import logging.config
-import json
+import datetime
+from string import printable
+from zoneinfo import ZoneInfo
+import logging
+from settings import settings
 
 
-logging.config.fileConfig('./logging.ini')
-with open('./config.json', 'r') as file:
-    config = json.load(file)
+settings.configure_logging()
+config = settings.get_config()
 
+MIN_LEN_STR = config['min_len_str']
+MAX_LEN_STR = config['max_len_str']
+SKIP_WORKING_HOURS = config['skip_working_hours'] == 'True'
 
-def text_input_validator(message):
-    min_len = config['min_len_str']
-    max_len = config['max_len_str']
+# Text input may contain only ASCII letters, digits, punctuation and whitespace.
+# Whitespace is anything str.isspace() accepts: the ASCII separators \x1c-\x1f are allowed as is,
+# non-ASCII whitespace (e.g. the no-break space from mobile keyboards) is mapped to a plain space first.
+TEXT_INPUT_CHARS = (printable + '\x1c\x1d\x1e\x1f').encode('ascii')
 
-    length_valid = min_len <= len(message.text) <= max_len
-    # pattern = r'^[A-Za-z0-9\s!"#$%&\'()*+,-.\/:;<=>?@\[\\\]^_`\}\{|~]{{{}, {}}}+$'.format(min_len, max_len)
-    character_valid = re.match(r"^[A-Za-z0-9\s!\"#$%&\'()*+,-./:;<=>?@\[\\\]^_`{|}~]+$", message.text) is not None
-    # result = re.search(pattern, message.text)
-    return length_valid and character_valid
+# Working hours are checked in this time zone
+WORKING_HOURS_TZ = ZoneInfo('Europe/Lisbon')
+# Working hours as HHMM, Monday to Friday from 09:30 until 19:59
+OPENING_TIME = 930
+CLOSING_TIME = 2000
+
+
+def text_input_validator(message):
+    text = message.text
+    if not text or not MIN_LEN_STR <= len(text) <= MAX_LEN_STR:
+        return False
+    if not text.isascii():
+        text = ''.join(' ' if char.isspace() else char for char in text)
+    # deleting every allowed byte leaves nothing behind only if all characters are allowed
+    try:
+        return not text.encode('ascii').translate(None, TEXT_INPUT_CHARS)
+    except UnicodeEncodeError:
+        return False
 
 
 def is_int(string):
+    # plain digit strings are the common case and need no exception handling
+    if string.isdecimal():
+        return True
     try:
         int(string)
         return True
     except ValueError:
-        logging.error("Incorrect input value for int conversion: %s", string)
+        logging.warning("Incorrect input value for int conversion: %s", string)
         return False
 
 
 def is_float(string):
+    if string.replace('.', '', 1).isdecimal():
+        return True
     try:
         float(string)
         return True
     except ValueError:
-        logging.error("Incorrect input value for float conversion: %s", string)
+        logging.warning("Incorrect input value for float conversion: %s", string)
         return False
 
 
 def check_working_hours():
-    if config['skip_working_hours'] == 'True':
+    if SKIP_WORKING_HOURS:
         return True
-    now = datetime.datetime.now(pytz.timezone('Europe/Lisbon'))
-    # now = datetime.datetime.now(pytz.timezone('Asia/Jerusalem'))
-    # now = datetime.datetime.now(pytz.timezone('America/New_York'))
-    if now.weekday() > 5:
+    now = datetime.datetime.now(WORKING_HOURS_TZ)
+    if now.weekday() >= 5:
         return False
-    else:
-        if now.hour < 9 or now.hour > 19:
-            return False
-        elif now.hour == 9 and now.minute < 30:
-            return False
-        else:
-            return True
+    return OPENING_TIME <= now.hour * 100 + now.minute < CLOSING_TIME